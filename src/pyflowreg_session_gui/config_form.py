@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import copy
 import json
-import types
-from dataclasses import dataclass
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Annotated, Any, Callable, Literal, Union, get_args, get_origin
+from typing import Any, Callable
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -29,7 +32,19 @@ from PySide6.QtWidgets import (
 )
 
 from .message_dialogs import show_exception, show_info
-from .model_utils import MISSING, build_model, iter_model_fields, model_to_dict
+from .model_utils import (
+    MISSING,
+    EditorKind,
+    ModelFieldSpec,
+    build_model,
+    iter_model_fields,
+    model_to_dict,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 EXCLUDED_SESSION_FIELDS = {"scheduler", "flow_backend"}
 
@@ -69,12 +84,37 @@ FALLBACK_FLOW_OPTIONS_TEMPLATE: dict[str, Any] = {
 }
 
 
+# orjson rejects NaN/Infinity/out-of-range literals and parses integers wider than 64 bit as
+# floats; such input goes through the stdlib parser so values match plain json.loads. Every
+# integer outside orjson's range (below -2**63 or above 2**64 - 1) has at least 19 digits.
+_WIDE_INT_RE = re.compile(r"\d{19,}")
+
+
+def _fast_loads(text: str) -> Any:
+    if orjson is not None and _WIDE_INT_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _copy_json(value: Any) -> Any:
+    # Parse caches hand out copies so callers can never mutate the cached value. Only JSON
+    # containers are copied, which is far cheaper than parsing the text again.
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
 @dataclass
 class _EditorBinding:
+    editor: QWidget
     getter: Callable[[], Any]
     setter: Callable[[Any], None]
-    resetter: Callable[[], None]
-    default: Any
+    restore_default: Callable[[], None]
 
 
 def _is_pydantic_undefined(value: Any) -> bool:
@@ -151,6 +191,7 @@ class PathPickerWidget(QWidget):
     def __init__(self, pick_directory: bool, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._pick_directory = pick_directory
+        self._dialog: QFileDialog | None = None
 
         self.line_edit = QLineEdit(self)
         self.browse_button = QPushButton("Browse", self)
@@ -161,16 +202,28 @@ class PathPickerWidget(QWidget):
         layout.addWidget(self.line_edit)
         layout.addWidget(self.browse_button)
 
+    def _file_dialog(self) -> QFileDialog:
+        # Reused across clicks so the dialog keeps its last directory and warm file model.
+        if self._dialog is None:
+            dialog = QFileDialog(self)
+            if self._pick_directory:
+                dialog.setWindowTitle("Select directory")
+                dialog.setFileMode(QFileDialog.FileMode.Directory)
+                dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+            else:
+                dialog.setWindowTitle("Select file")
+                dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._dialog = dialog
+        return self._dialog
+
     def _browse(self) -> None:
-        if self._pick_directory:
-            selected = QFileDialog.getExistingDirectory(self, "Select directory")
-            if selected:
-                self.line_edit.setText(selected)
+        dialog = self._file_dialog()
+        if not dialog.exec():
             return
 
-        selected, _ = QFileDialog.getOpenFileName(self, "Select file")
-        if selected:
-            self.line_edit.setText(selected)
+        selected = dialog.selectedFiles()
+        if selected and selected[0]:
+            self.line_edit.setText(selected[0])
 
 
 class FlowOptionsDialog(QDialog):
@@ -187,6 +240,12 @@ class FlowOptionsDialog(QDialog):
 
         self.inline_editor = QPlainTextEdit(self)
         self.inline_editor.setPlaceholderText(json.dumps(self._template, indent=2))
+        # Last successfully parsed inline text and its value; keyed on the text itself so it
+        # stays valid regardless of how the editor content was changed.
+        self._parsed_text: str | None = None
+        self._parsed_value: dict[str, Any] = {}
+        self._validated_revision: int | None = None
+        self._validated_key_count = 0
 
         self.file_picker = PathPickerWidget(pick_directory=False, parent=self)
 
@@ -231,15 +290,19 @@ class FlowOptionsDialog(QDialog):
         text = self.inline_editor.toPlainText().strip()
         if not text:
             return {}
+        if text == self._parsed_text:
+            return _copy_json(self._parsed_value)
 
         try:
-            parsed = json.loads(text)
+            parsed = _fast_loads(text)
         except json.JSONDecodeError as exc:
             raise ValueError(f"Invalid flow_options JSON: {exc}") from exc
 
         if not isinstance(parsed, dict):
             raise ValueError("Inline flow_options JSON must be an object.")
-        return parsed
+        self._parsed_text = text
+        self._parsed_value = parsed
+        return _copy_json(parsed)
 
     def _insert_template(self) -> None:
         merged = dict(self._template)
@@ -252,13 +315,19 @@ class FlowOptionsDialog(QDialog):
         self.inline_editor.setPlainText(json.dumps(merged, indent=2))
 
     def _validate_inline_json(self) -> None:
-        try:
-            parsed = self._parse_inline_json()
-        except Exception as exc:
-            show_exception(self, "JSON Error", exc)
-            return
+        # The document revision changes with every edit, so an unchanged revision means the
+        # text already passed validation and does not even need to be read back.
+        revision = self.inline_editor.document().revision()
+        if revision != self._validated_revision:
+            try:
+                parsed = self._parse_inline_json()
+            except Exception as exc:
+                show_exception(self, "JSON Error", exc)
+                return
+            self._validated_revision = revision
+            self._validated_key_count = len(parsed)
 
-        show_info(self, "JSON", f"JSON is valid ({len(parsed)} key(s)).")
+        show_info(self, "JSON", f"JSON is valid ({self._validated_key_count} key(s)).")
 
     def get_value(self) -> dict[str, Any] | str:
         mode = self.mode_combo.currentData()
@@ -361,7 +430,7 @@ class FlowOptionsEditor(QWidget):
 
     def set_value(self, value: Any) -> None:
         if isinstance(value, dict):
-            self._value = dict(value)
+            self._value = _copy_json(value)
         elif value in (None, ""):
             self._value = {}
         else:
@@ -373,37 +442,217 @@ class FlowOptionsEditor(QWidget):
         self._refresh_summary()
 
 
-def _strip_annotated(annotation: Any) -> Any:
-    while get_origin(annotation) is Annotated:
-        args = get_args(annotation)
-        if not args:
-            break
-        annotation = args[0]
-    return annotation
+class _PathFieldEditor(PathPickerWidget):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(pick_directory=spec.name != "center", parent=parent)
+        self._optional = spec.optional
+
+    def get_value(self) -> Any:
+        text = self.line_edit.text().strip()
+        if self._optional and not text:
+            return None
+        return text
+
+    def set_value(self, value: Any) -> None:
+        self.line_edit.setText("" if value is None else str(value))
+
+    def reset(self) -> None:
+        self.line_edit.clear()
+
 
+class _BoolEditor(QCheckBox):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
 
-def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
-    annotation = _strip_annotated(annotation)
-    origin = get_origin(annotation)
-    if origin in (Union, types.UnionType):
-        args = [_strip_annotated(arg) for arg in get_args(annotation) if arg is not type(None)]
-        if len(args) == 1:
-            return args[0], True
-    return annotation, False
+    def get_value(self) -> bool:
+        return self.isChecked()
 
+    def set_value(self, value: Any) -> None:
+        self.setChecked(bool(value))
 
-def _annotation_has_type(annotation: Any, target: type[Any]) -> bool:
-    base, _ = _unwrap_optional(annotation)
-    if base is target:
-        return True
+    def reset(self) -> None:
+        self.setChecked(False)
 
-    origin = get_origin(base)
-    if origin is target:
-        return True
-    if origin in (Union, types.UnionType):
-        return any(_annotation_has_type(arg, target) for arg in get_args(base))
 
-    return False
+class _IntEditor(QSpinBox):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setRange(-1_000_000_000, 1_000_000_000)
+
+    def get_value(self) -> int:
+        return int(self.value())
+
+    def set_value(self, value: Any) -> None:
+        self.setValue(int(value))
+
+    def reset(self) -> None:
+        self.setValue(0)
+
+
+class _FloatEditor(QDoubleSpinBox):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setRange(-1_000_000_000.0, 1_000_000_000.0)
+        self.setDecimals(6)
+
+    def get_value(self) -> float:
+        return float(self.value())
+
+    def set_value(self, value: Any) -> None:
+        self.setValue(float(value))
+
+    def reset(self) -> None:
+        self.setValue(0.0)
+
+
+class _LiteralEditor(QComboBox):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        # Python-side lookup so set_value does not round-trip every itemData() through Qt.
+        self._value_to_index: dict[Any, int] = {}
+        for index, (label, option) in enumerate(self._items(spec)):
+            self.addItem(label, userData=option)
+            for key in self._lookup_keys(option):
+                self._value_to_index.setdefault(key, index)
+
+    @staticmethod
+    def _items(spec: ModelFieldSpec) -> list[tuple[str, Any]]:
+        return [(str(option), option) for option in spec.literal_options]
+
+    @staticmethod
+    def _lookup_keys(option: Any) -> tuple[Any, ...]:
+        return (option,)
+
+    def get_value(self) -> Any:
+        return self.currentData()
+
+    def set_value(self, value: Any) -> None:
+        try:
+            index = self._value_to_index.get(value)
+        except TypeError:
+            return
+        if index is not None:
+            self.setCurrentIndex(index)
+
+    def reset(self) -> None:
+        if self.count() > 0:
+            self.setCurrentIndex(0)
+
+
+class _EnumEditor(_LiteralEditor):
+    @staticmethod
+    def _items(spec: ModelFieldSpec) -> list[tuple[str, Any]]:
+        return [(str(enum_value.value), enum_value) for enum_value in spec.enum_cls or ()]
+
+    @staticmethod
+    def _lookup_keys(option: Any) -> tuple[Any, ...]:
+        # Accept raw values too, e.g. strings read back from YAML.
+        return (option, option.value)
+
+
+class _DictEditor(QPlainTextEdit):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._field_name = spec.name
+        self._optional = spec.optional
+        self._parsed_text: str | None = None
+        self._parsed_value: dict[str, Any] = {}
+        self.setPlaceholderText('{"key": "value"}')
+
+    def get_value(self) -> Any:
+        text = self.toPlainText().strip()
+        if not text:
+            return {} if not self._optional else None
+        if text == self._parsed_text:
+            return _copy_json(self._parsed_value)
+        try:
+            parsed = _fast_loads(text)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON for '{self._field_name}': {exc}") from exc
+        if not isinstance(parsed, dict):
+            raise ValueError(f"Field '{self._field_name}' expects a JSON object.")
+        self._parsed_text = text
+        self._parsed_value = parsed
+        return _copy_json(parsed)
+
+    def set_value(self, value: Any) -> None:
+        if value is None:
+            self.setPlainText("")
+        else:
+            self.setPlainText(json.dumps(value, indent=2))
+
+    def reset(self) -> None:
+        self.setPlainText("{}" if not self._optional else "")
+
+
+class _StrEditor(QLineEdit):
+    def __init__(self, spec: ModelFieldSpec, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._optional = spec.optional
+
+    def get_value(self) -> Any:
+        text = self.text().strip()
+        if self._optional and not text:
+            return None
+        return text
+
+    def set_value(self, value: Any) -> None:
+        self.setText("" if value is None else str(value))
+
+    def reset(self) -> None:
+        self.clear()
+
+
+# Factories take (field spec, parent) and return a widget exposing get_value/set_value/reset.
+_EditorFactory = Callable[[ModelFieldSpec, QWidget], QWidget]
+
+_FIELD_EDITOR_FACTORIES: dict[str, _EditorFactory] = {
+    "flow_options": lambda spec, parent: FlowOptionsEditor(parent),
+    "root": _PathFieldEditor,
+    "output_root": _PathFieldEditor,
+    "final_results": _PathFieldEditor,
+    "center": _PathFieldEditor,
+}
+
+
+def _fallback_editor(spec: ModelFieldSpec, parent: QWidget) -> QWidget:
+    # Unknown annotations are edited as plain text and never coerced to None.
+    return _StrEditor(replace(spec, optional=False), parent)
+
+
+_KIND_EDITOR_FACTORIES: dict[EditorKind, _EditorFactory] = {
+    EditorKind.BOOL: _BoolEditor,
+    EditorKind.INT: _IntEditor,
+    EditorKind.FLOAT: _FloatEditor,
+    EditorKind.LITERAL: _LiteralEditor,
+    EditorKind.ENUM: _EnumEditor,
+    EditorKind.DICT: _DictEditor,
+    EditorKind.PATH: _StrEditor,
+    EditorKind.STR: _StrEditor,
+    EditorKind.OTHER: _fallback_editor,
+}
+
+
+def _resolve_editor_factory(spec: ModelFieldSpec) -> _EditorFactory:
+    factory = _FIELD_EDITOR_FACTORIES.get(spec.name)
+    if factory is not None:
+        return factory
+    return _KIND_EDITOR_FACTORIES[spec.kind]
+
+
+# Programmatic updates are applied with the editor's signals blocked.
+def _set_editor_value(editor: QWidget, value: Any) -> None:
+    with QSignalBlocker(editor):
+        editor.set_value(value)
+
+
+def _restore_editor_default(editor: QWidget, spec: ModelFieldSpec) -> None:
+    default = spec.make_default()
+    with QSignalBlocker(editor):
+        if default is MISSING:
+            editor.reset()
+        else:
+            editor.set_value(default)
 
 
 class SessionConfigForm(QWidget):
@@ -411,7 +660,7 @@ class SessionConfigForm(QWidget):
         super().__init__(parent)
         self._session_config_cls = session_config_cls
         self._bindings: dict[str, _EditorBinding] = {}
-        self._hidden_defaults: dict[str, Any] = {}
+        self._hidden_fields: dict[str, ModelFieldSpec] = {}
         self._hidden_values: dict[str, Any] = {}
 
         form_layout = QFormLayout(self)
@@ -419,245 +668,26 @@ class SessionConfigForm(QWidget):
 
         for field_spec in iter_model_fields(session_config_cls):
             if field_spec.name in EXCLUDED_SESSION_FIELDS:
-                self._hidden_defaults[field_spec.name] = field_spec.default
-                if field_spec.default is not MISSING:
-                    self._hidden_values[field_spec.name] = field_spec.default
+                self._hidden_fields[field_spec.name] = field_spec
+                default = field_spec.make_default()
+                if default is not MISSING:
+                    self._hidden_values[field_spec.name] = default
                 continue
 
-            binding, widget = self._create_editor(
-                field_spec.name, field_spec.annotation, field_spec.default
-            )
+            binding = self._create_editor(field_spec)
             self._bindings[field_spec.name] = binding
-            form_layout.addRow(field_spec.name, widget)
-
-    def _create_editor(
-        self, field_name: str, annotation: Any, default: Any
-    ) -> tuple[_EditorBinding, QWidget]:
-        base_annotation, optional = _unwrap_optional(annotation)
-
-        if field_name == "flow_options":
-            editor = FlowOptionsEditor(self)
-            binding = _EditorBinding(
-                getter=editor.get_value,
-                setter=editor.set_value,
-                resetter=editor.reset,
-                default=default,
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            else:
-                binding.resetter()
-            return binding, editor
-
-        if field_name in {"root", "output_root", "final_results", "center"}:
-            editor = PathPickerWidget(pick_directory=field_name != "center", parent=self)
-
-            def getter() -> Any:
-                text = editor.line_edit.text().strip()
-                if optional and not text:
-                    return None
-                return text
-
-            def setter(value: Any) -> None:
-                editor.line_edit.setText("" if value is None else str(value))
-
-            def resetter() -> None:
-                editor.line_edit.clear()
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            return binding, editor
-
-        if base_annotation is bool:
-            editor = QCheckBox(self)
-
-            def getter() -> bool:
-                return editor.isChecked()
-
-            def setter(value: Any) -> None:
-                editor.setChecked(bool(value))
-
-            def resetter() -> None:
-                editor.setChecked(False)
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            return binding, editor
-
-        if base_annotation is int:
-            editor = QSpinBox(self)
-            editor.setRange(-1_000_000_000, 1_000_000_000)
-
-            def getter() -> int:
-                return int(editor.value())
-
-            def setter(value: Any) -> None:
-                editor.setValue(int(value))
-
-            def resetter() -> None:
-                editor.setValue(0)
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            return binding, editor
-
-        if base_annotation is float:
-            editor = QDoubleSpinBox(self)
-            editor.setRange(-1_000_000_000.0, 1_000_000_000.0)
-            editor.setDecimals(6)
-
-            def getter() -> float:
-                return float(editor.value())
-
-            def setter(value: Any) -> None:
-                editor.setValue(float(value))
-
-            def resetter() -> None:
-                editor.setValue(0.0)
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            return binding, editor
-
-        if get_origin(base_annotation) is Literal:
-            options = list(get_args(base_annotation))
-            editor = QComboBox(self)
-            for option in options:
-                editor.addItem(str(option), userData=option)
-
-            def getter() -> Any:
-                return editor.currentData()
-
-            def setter(value: Any) -> None:
-                for index in range(editor.count()):
-                    if editor.itemData(index) == value:
-                        editor.setCurrentIndex(index)
-                        return
-
-            def resetter() -> None:
-                if editor.count() > 0:
-                    editor.setCurrentIndex(0)
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            else:
-                binding.resetter()
-            return binding, editor
-
-        if isinstance(base_annotation, type) and issubclass(base_annotation, Enum):
-            enum_values = list(base_annotation)
-            editor = QComboBox(self)
-            for enum_value in enum_values:
-                editor.addItem(str(enum_value.value), userData=enum_value)
-
-            def getter() -> Any:
-                return editor.currentData()
-
-            def setter(value: Any) -> None:
-                for index in range(editor.count()):
-                    if editor.itemData(index) == value:
-                        editor.setCurrentIndex(index)
-                        return
-
-            def resetter() -> None:
-                if editor.count() > 0:
-                    editor.setCurrentIndex(0)
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            else:
-                binding.resetter()
-            return binding, editor
-
-        if base_annotation is dict or _annotation_has_type(base_annotation, dict):
-            editor = QPlainTextEdit(self)
-            editor.setPlaceholderText('{"key": "value"}')
-
-            def getter() -> Any:
-                text = editor.toPlainText().strip()
-                if not text:
-                    return {} if not optional else None
-                try:
-                    parsed = json.loads(text)
-                except json.JSONDecodeError as exc:
-                    raise ValueError(f"Invalid JSON for '{field_name}': {exc}") from exc
-                if not isinstance(parsed, dict):
-                    raise ValueError(f"Field '{field_name}' expects a JSON object.")
-                return parsed
-
-            def setter(value: Any) -> None:
-                if value is None:
-                    editor.setPlainText("")
-                else:
-                    editor.setPlainText(json.dumps(value, indent=2))
-
-            def resetter() -> None:
-                editor.setPlainText("{}" if not optional else "")
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            else:
-                binding.resetter()
-            return binding, editor
-
-        if base_annotation in {str, Path} or _annotation_has_type(base_annotation, Path):
-            editor = QLineEdit(self)
-
-            def getter() -> Any:
-                text = editor.text().strip()
-                if optional and not text:
-                    return None
-                return text
-
-            def setter(value: Any) -> None:
-                editor.setText("" if value is None else str(value))
-
-            def resetter() -> None:
-                editor.clear()
-
-            binding = _EditorBinding(
-                getter=getter, setter=setter, resetter=resetter, default=default
-            )
-            if default is not MISSING:
-                binding.setter(default)
-            return binding, editor
-
-        editor = QLineEdit(self)
-
-        def getter() -> str:
-            return editor.text().strip()
-
-        def setter(value: Any) -> None:
-            editor.setText("" if value is None else str(value))
-
-        def resetter() -> None:
-            editor.clear()
-
-        binding = _EditorBinding(getter=getter, setter=setter, resetter=resetter, default=default)
-        if default is not MISSING:
-            binding.setter(default)
-        return binding, editor
+            form_layout.addRow(field_spec.name, binding.editor)
+
+    def _create_editor(self, spec: ModelFieldSpec) -> _EditorBinding:
+        editor = _resolve_editor_factory(spec)(spec, self)
+        binding = _EditorBinding(
+            editor=editor,
+            getter=editor.get_value,
+            setter=partial(_set_editor_value, editor),
+            restore_default=partial(_restore_editor_default, editor, spec),
+        )
+        binding.restore_default()
+        return binding
 
     def get_form_data(self) -> dict[str, Any]:
         data: dict[str, Any] = {}
@@ -667,28 +697,53 @@ class SessionConfigForm(QWidget):
         data.update(self._hidden_values)
         return data
 
+    @contextmanager
+    def _batched_updates(self) -> Iterator[None]:
+        # Suppress repaints and signals while many rows change; one repaint follows re-enabling.
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        signals_blocked = self.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(updates_enabled)
+
     def set_form_data(self, values: dict[str, Any]) -> None:
-        for name, value in values.items():
-            if name in self._hidden_defaults:
-                self._hidden_values[name] = value
-                continue
+        with self._batched_updates():
+            for name, value in values.items():
+                if name in self._hidden_fields:
+                    self._hidden_values[name] = value
+                    continue
 
-            binding = self._bindings.get(name)
-            if binding is None:
-                continue
-            binding.setter(value)
+                binding = self._bindings.get(name)
+                if binding is None:
+                    continue
+                binding.setter(value)
 
     def set_from_config(self, config: Any) -> None:
-        self.set_form_data(model_to_dict(config))
+        # Field values are read straight off the model instead of dumping the whole nested
+        # tree; model_to_dict remains for objects that do not expose fields as attributes.
+        # Editors keep converted values, but hidden values are stored as given, so those few
+        # are copied to avoid sharing state with the loaded config.
+        values: dict[str, Any] = {}
+        for name in self._bindings:
+            value = getattr(config, name, MISSING)
+            if value is not MISSING:
+                values[name] = value
+        for name in self._hidden_fields:
+            value = getattr(config, name, MISSING)
+            if value is not MISSING:
+                values[name] = copy.deepcopy(value)
+        self.set_form_data(values or model_to_dict(config))
 
     def reset_to_defaults(self) -> None:
-        for binding in self._bindings.values():
-            if binding.default is MISSING:
-                binding.resetter()
-            else:
-                binding.setter(binding.default)
+        with self._batched_updates():
+            for binding in self._bindings.values():
+                binding.restore_default()
 
-        for field_name, default in self._hidden_defaults.items():
+        for field_name, field_spec in self._hidden_fields.items():
+            default = field_spec.make_default()
             if default is MISSING:
                 self._hidden_values.pop(field_name, None)
             else:
@@ -1,26 +1,36 @@
 from __future__ import annotations
 
+import codecs
+import os
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, QProcess, Signal
+from PySide6.QtCore import QObject, QProcess, QStandardPaths, QTimer, Signal
 
 from .serialization import serialize_config_to_yaml
 
+DONE_SENTINEL = "__DONE__"
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Long-lived worker: the pyflowreg stage modules are imported once, then every
+# "RUN <config path> <mode>" line on stdin starts a run. Completion is reported on stdout as
+# "__DONE__ <rc>" so the GUI can tell runs apart without the process exiting.
 RUNNER_SCRIPT = r"""
 import sys
+import traceback
 
 from pyflowreg.session.config import SessionConfig
 from pyflowreg.session.stage1_compensate import run_stage1
 from pyflowreg.session.stage2_between_avgs import run_stage2
 from pyflowreg.session.stage3_valid_mask import run_stage3
 
+DONE_SENTINEL = "__DONE__"
 
-def main() -> None:
-    cfg_path = sys.argv[1]
-    mode = sys.argv[2]
+
+def run(cfg_path: str, mode: str) -> None:
     config = SessionConfig.from_file(cfg_path)
     print(f"Loaded config: {cfg_path}", flush=True)
 
@@ -56,11 +66,82 @@ def main() -> None:
     raise ValueError(f"Unknown mode: {mode}")
 
 
+def main() -> None:
+    for raw_line in sys.stdin.buffer:
+        line = raw_line.decode("utf-8").rstrip("\r\n")
+        if not line:
+            continue
+
+        command, _, args = line.partition(" ")
+        cfg_path, _, mode = args.rpartition(" ")
+        if command != "RUN" or not cfg_path:
+            print(f"Unknown worker command: {line}", file=sys.stderr, flush=True)
+            continue
+
+        try:
+            run(cfg_path, mode)
+        except Exception:
+            # On stdout, so the traceback is read before the sentinel that follows it.
+            traceback.print_exc(file=sys.stdout)
+            rc = 1
+        else:
+            rc = 0
+        sys.stderr.flush()
+        print(f"{DONE_SENTINEL} {rc}", flush=True)
+
+
 if __name__ == "__main__":
     main()
 """
 
 
+WORKER_MODULE = "pyflowreg_session_gui_worker"
+
+_UTF8_DECODER = codecs.getincrementaldecoder("utf-8")
+
+# Importing (rather than executing) the materialized script lets CPython reuse its cached
+# bytecode; a __main__ script is recompiled on every launch. The directory is appended to
+# sys.path so it can never shadow real packages.
+_WORKER_BOOTSTRAP = (
+    f"import sys; sys.path.append(sys.argv[1]); import {WORKER_MODULE}; {WORKER_MODULE}.main()"
+)
+
+
+@lru_cache(maxsize=1)
+def _worker_script_dir() -> Path | None:
+    """Write RUNNER_SCRIPT into the per-user cache directory if missing or outdated.
+
+    Returns None when no writable location is available; callers then fall back to ``-c``.
+    """
+    cache_root = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    if not cache_root:
+        return None
+
+    script_dir = Path(cache_root) / "pyflowreg_session_gui"
+    script_path = script_dir / f"{WORKER_MODULE}.py"
+    source = RUNNER_SCRIPT.encode("utf-8")
+    try:
+        if not script_path.is_file() or script_path.read_bytes() != source:
+            script_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = script_dir / f"{WORKER_MODULE}.{os.getpid()}.tmp"
+            tmp_path.write_bytes(source)
+            os.replace(tmp_path, script_path)
+    except OSError:
+        return None
+    return script_dir
+
+
+def _split_sentinel_prefix(text: str) -> tuple[str, str]:
+    """Split ``text`` into output that can be shown and a tail that may begin a sentinel."""
+    index = text.find(DONE_SENTINEL)
+    if index >= 0:
+        return text[:index], text[index:]
+    for size in range(min(len(text), len(DONE_SENTINEL) - 1), 0, -1):
+        if DONE_SENTINEL.startswith(text[-size:]):
+            return text[:-size], text[-size:]
+    return text, ""
+
+
 class LocalRunner(QObject):
     log_emitted = Signal(str)
     run_started = Signal()
@@ -71,61 +152,173 @@ class LocalRunner(QObject):
         super().__init__(parent)
         self._process: QProcess | None = None
         self._tmpdir: tempfile.TemporaryDirectory[str] | None = None
+        self._running = False
+        self._shutting_down = False
+        self._reset_streams()
+
+        # Output is coalesced so noisy stages emit one log_emitted per interval, not per read.
+        self._log_buf: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
 
     def is_running(self) -> bool:
-        return self._process is not None and self._process.state() != QProcess.NotRunning
+        return self._running
 
     def terminate(self) -> None:
         if self._process is not None:
             self._process.kill()
 
+    def shutdown(self) -> None:
+        """Stop the worker process; an active run is aborted without completion signals."""
+        process = self._process
+        if process is None:
+            return
+        self._shutting_down = True
+        try:
+            if self._running:
+                # The worker only reads stdin between runs, so an active run is killed outright.
+                process.kill()
+            else:
+                process.closeWriteChannel()
+                if not process.waitForFinished(2000):
+                    process.kill()
+            process.waitForFinished(1000)
+        finally:
+            self._shutting_down = False
+
     def start(self, config: Any, mode: str) -> None:
         if self.is_running():
             raise RuntimeError("A local run is already in progress.")
 
         self._tmpdir = tempfile.TemporaryDirectory(prefix="pyflowreg_session_gui_")
         config_path = Path(self._tmpdir.name) / "session_config.yaml"
-        serialize_config_to_yaml(config, config_path, prefer_relative=True)
+        try:
+            serialize_config_to_yaml(config, config_path, prefer_relative=True)
+            process = self._ensure_worker()
+        except Exception:
+            self._cleanup()
+            raise
+
+        process.write(f"RUN {config_path} {mode}\n".encode())
+        self._running = True
+        self.run_started.emit()
+
+    def _ensure_worker(self) -> QProcess:
+        if self._process is not None and self._process.state() != QProcess.NotRunning:
+            return self._process
 
         process = QProcess(self)
         process.setProgram(sys.executable)
-        process.setArguments(["-u", "-c", RUNNER_SCRIPT, str(config_path), mode])
+        script_dir = _worker_script_dir()
+        if script_dir is None:
+            process.setArguments(["-u", "-c", RUNNER_SCRIPT])
+        else:
+            process.setArguments(["-u", "-c", _WORKER_BOOTSTRAP, str(script_dir)])
 
         process.readyReadStandardOutput.connect(self._on_stdout)
         process.readyReadStandardError.connect(self._on_stderr)
         process.finished.connect(self._on_finished)
 
         self._process = process
+        self._reset_streams()
         process.start()
 
         if not process.waitForStarted(5000):
-            self._cleanup()
+            self._process = None
+            process.deleteLater()
             raise RuntimeError("Failed to start local worker subprocess.")
+        return process
 
-        self.run_started.emit()
+    def _reset_streams(self) -> None:
+        # Incremental decoders keep a multi-byte UTF-8 sequence split across two reads intact.
+        self._stdout_decoder = _UTF8_DECODER(errors="replace")
+        self._stderr_decoder = _UTF8_DECODER(errors="replace")
+        self._stdout_buffer = ""
+        self._stdout_line_open = False
 
     def _on_stdout(self) -> None:
         if self._process is None:
             return
-        data = bytes(self._process.readAllStandardOutput()).decode("utf-8", errors="replace")
-        if data:
-            self.log_emitted.emit(data.rstrip("\n"))
+        data = self._stdout_decoder.decode(bytes(self._process.readAllStandardOutput()))
+        if not data:
+            return
+
+        self._stdout_buffer += data
+        *lines, tail = self._stdout_buffer.split("\n")
+        for line in lines:
+            line = line.rstrip("\r")
+            line_open, self._stdout_line_open = self._stdout_line_open, False
+            # The sentinel may follow output that did not end with a newline.
+            text, marker, rc_text = line.rpartition(f"{DONE_SENTINEL} ")
+            if marker and rc_text.lstrip("-").isdigit():
+                if text:
+                    self._queue_log(text)
+                self._on_run_done(int(rc_text))
+                continue
+            # An empty line only terminates a partial line that was already shown.
+            if line or not line_open:
+                self._queue_log(line)
+
+        # A partial line is shown right away; only a possible sentinel start is held back.
+        shown, self._stdout_buffer = _split_sentinel_prefix(tail)
+        shown = shown.rstrip("\r")
+        if shown:
+            self._queue_log(shown)
+            self._stdout_line_open = True
 
     def _on_stderr(self) -> None:
         if self._process is None:
             return
-        data = bytes(self._process.readAllStandardError()).decode("utf-8", errors="replace")
+        data = self._stderr_decoder.decode(bytes(self._process.readAllStandardError()))
         if data:
-            self.log_emitted.emit(f"[stderr] {data.rstrip()}")
+            self._queue_log(f"[stderr] {data.rstrip()}")
 
-    def _on_finished(self, exit_code: int, _exit_status: QProcess.ExitStatus) -> None:
+    def _queue_log(self, text: str) -> None:
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self) -> None:
+        self._log_timer.stop()
+        if self._log_buf:
+            text = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            self.log_emitted.emit(text)
+
+    def _on_run_done(self, exit_code: int) -> None:
+        # Output that already arrived is logged ahead of the completion signals.
+        self._on_stderr()
+        self._flush_log()
+        self._running = False
         if exit_code != 0:
             self.run_failed.emit(f"Local run failed with exit code {exit_code}.")
         self.run_finished.emit(exit_code)
         self._cleanup()
 
+    def _on_finished(self, exit_code: int, _exit_status: QProcess.ExitStatus) -> None:
+        self._on_stdout()
+        if self._stdout_buffer:
+            self._queue_log(self._stdout_buffer)
+        self._on_stderr()
+        self._flush_log()
+        process = self._process
+        self._process = None
+        self._reset_streams()
+        if process is not None:
+            process.deleteLater()
+
+        if self._running:
+            # The worker died mid-run (crash, kill, or closed stdin).
+            self._running = False
+            if not self._shutting_down:
+                exit_code = exit_code or 1
+                self.run_failed.emit(f"Local worker exited with code {exit_code} during the run.")
+                self.run_finished.emit(exit_code)
+            self._cleanup()
+
     def _cleanup(self) -> None:
         if self._tmpdir is not None:
             self._tmpdir.cleanup()
         self._tmpdir = None
-        self._process = None
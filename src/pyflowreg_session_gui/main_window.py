@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from PySide6.QtGui import QCloseEvent
 from PySide6.QtWidgets import QMainWindow, QTabWidget
 
 from .config_tab import ConfigTab
@@ -34,3 +35,7 @@ class MainWindow(QMainWindow):
 
     def _get_current_config(self) -> Any | None:
         return self.config_tab.get_validated_config(show_dialog=True)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self.local_tab.shutdown()
+        super().closeEvent(event)
@@ -1,18 +1,57 @@
 from __future__ import annotations
 
 import copy
+import pickle
+import types
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
 
 MISSING = object()
 
 
+class EditorKind(Enum):
+    BOOL = "bool"
+    INT = "int"
+    FLOAT = "float"
+    LITERAL = "literal"
+    ENUM = "enum"
+    DICT = "dict"
+    PATH = "path"
+    STR = "str"
+    OTHER = "other"
+
+
 @dataclass(frozen=True)
 class ModelFieldSpec:
     name: str
     annotation: Any
     default: Any = MISSING
+    default_factory: Callable[[], Any] | None = None
     required: bool = False
+    # Resolved once from the annotation so form building never re-walks typing constructs.
+    kind: EditorKind = EditorKind.OTHER
+    optional: bool = False
+    literal_options: tuple[Any, ...] = ()
+    enum_cls: type[Enum] | None = None
+
+    def make_default(self) -> Any:
+        """Return a fresh default value, or MISSING when the field has none.
+
+        Specs are cached and shared, so the stored default is copied and a default factory is
+        called on every use; callers may mutate the result.
+        """
+        if self.default_factory is not None:
+            try:
+                return self.default_factory()
+            except Exception:
+                return MISSING
+        if self.default is MISSING:
+            return MISSING
+        return copy.deepcopy(self.default)
 
 
 def _is_pydantic_undefined(value: Any) -> bool:
@@ -29,17 +68,14 @@ def _field_annotation(field: Any) -> Any:
     return str
 
 
-def _field_default(field: Any) -> Any:
+def _field_default(field: Any) -> tuple[Any, Callable[[], Any] | None]:
     default = getattr(field, "default", MISSING)
     if default is not MISSING and not _is_pydantic_undefined(default):
-        return default
+        return default, None
     default_factory = getattr(field, "default_factory", None)
     if callable(default_factory):
-        try:
-            return default_factory()
-        except Exception:
-            return MISSING
-    return MISSING
+        return MISSING, default_factory
+    return MISSING, None
 
 
 def _field_required(field: Any) -> bool:
@@ -53,7 +89,70 @@ def _field_required(field: Any) -> bool:
     return False
 
 
-def iter_model_fields(model_cls: type[Any]) -> list[ModelFieldSpec]:
+def _strip_annotated(annotation: Any) -> Any:
+    while get_origin(annotation) is Annotated:
+        args = get_args(annotation)
+        if not args:
+            break
+        annotation = args[0]
+    return annotation
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    annotation = _strip_annotated(annotation)
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [_strip_annotated(arg) for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _annotation_has_type(annotation: Any, target: type[Any]) -> bool:
+    base, _ = _unwrap_optional(annotation)
+    if base is target:
+        return True
+
+    origin = get_origin(base)
+    if origin is target:
+        return True
+    if origin in (Union, types.UnionType):
+        return any(_annotation_has_type(arg, target) for arg in get_args(base))
+
+    return False
+
+
+def _classify_annotation(annotation: Any) -> dict[str, Any]:
+    base, optional = _unwrap_optional(annotation)
+    info: dict[str, Any] = {"optional": optional}
+
+    if base is bool:
+        info["kind"] = EditorKind.BOOL
+    elif base is int:
+        info["kind"] = EditorKind.INT
+    elif base is float:
+        info["kind"] = EditorKind.FLOAT
+    elif get_origin(base) is Literal:
+        info["kind"] = EditorKind.LITERAL
+        info["literal_options"] = tuple(get_args(base))
+    elif isinstance(base, type) and issubclass(base, Enum):
+        info["kind"] = EditorKind.ENUM
+        info["enum_cls"] = base
+    elif base is dict or _annotation_has_type(base, dict):
+        info["kind"] = EditorKind.DICT
+    elif base is Path or _annotation_has_type(base, Path):
+        info["kind"] = EditorKind.PATH
+    elif base is str:
+        info["kind"] = EditorKind.STR
+    else:
+        info["kind"] = EditorKind.OTHER
+    return info
+
+
+@cache
+def iter_model_fields(model_cls: type[Any]) -> tuple[ModelFieldSpec, ...]:
+    # Field specs are fixed per class, so introspection runs once and the (immutable) result is
+    # shared by every form built for that class.
     raw_fields: dict[str, Any] | None = None
     if hasattr(model_cls, "model_fields"):
         raw_fields = getattr(model_cls, "model_fields")
@@ -67,37 +166,87 @@ def iter_model_fields(model_cls: type[Any]) -> list[ModelFieldSpec]:
     for name, field in raw_fields.items():
         annotation = _field_annotation(field)
         required = _field_required(field)
-        default = _field_default(field)
+        default, default_factory = _field_default(field)
         if required:
-            default = MISSING
+            default, default_factory = MISSING, None
         field_specs.append(
-            ModelFieldSpec(name=name, annotation=annotation, default=default, required=required)
+            ModelFieldSpec(
+                name=name,
+                annotation=annotation,
+                default=default,
+                default_factory=default_factory,
+                required=required,
+                **_classify_annotation(annotation),
+            )
         )
-    return field_specs
+    return tuple(field_specs)
+
+
+# The pydantic v2 / v1 / plain-class API is resolved once per model class; later calls are a
+# cache lookup plus a direct call instead of repeated hasattr probes.
+@cache
+def _dump_fn(model_cls: type[Any]) -> Callable[[Any, str], Any]:
+    if getattr(model_cls, "__pydantic_serializer__", None) is not None:
+        # pydantic v2: call the pydantic-core serializer that model_dump wraps directly. With
+        # mode="json" it returns only plain builtins (Path/Enum/tuple already converted). The
+        # attribute is read per call because model_rebuild() may replace it.
+        return lambda model, mode: model_cls.__pydantic_serializer__.to_python(model, mode=mode)
+    if hasattr(model_cls, "model_dump"):
+        model_dump = model_cls.model_dump
+        return lambda model, mode: model_dump(model, mode=mode)
+    if hasattr(model_cls, "dict"):
+        dump = model_cls.dict
+        return lambda model, _mode: dump(model)
+    return _vars_dump
+
+
+def _vars_dump(model: Any, _mode: str) -> dict[str, Any]:
+    try:
+        return vars(model)
+    except TypeError:
+        raise TypeError(f"Unsupported model type: {type(model)!r}") from None
+
+
+@cache
+def _validate_fn(model_cls: type[Any]) -> Callable[[dict[str, Any]], Any]:
+    if hasattr(model_cls, "model_validate"):
+        return model_cls.model_validate
+    return lambda values: model_cls(**values)
+
+
+@cache
+def _copy_fn(model_cls: type[Any]) -> Callable[[Any], Any]:
+    if hasattr(model_cls, "model_copy"):
+        model_copy = model_cls.model_copy
+        return lambda model: model_copy(model, deep=True)
+    if hasattr(model_cls, "copy"):
+        return _legacy_copy
+    return _pickle_copy
+
 
+def _legacy_copy(model: Any) -> Any:
+    try:
+        return model.copy(deep=True)
+    except TypeError:
+        return model.copy()
 
-def model_to_dict(model: Any) -> dict[str, Any]:
-    if hasattr(model, "model_dump"):
-        return dict(model.model_dump(mode="python"))
-    if hasattr(model, "dict"):
-        return dict(model.dict())
-    if hasattr(model, "__dict__"):
-        return dict(vars(model))
-    raise TypeError(f"Unsupported model type: {type(model)!r}")
+
+def _pickle_copy(model: Any) -> Any:
+    # A pickle round-trip runs in C and beats copy.deepcopy's per-object dispatch on data-heavy
+    # objects; deepcopy remains for objects that cannot be pickled (e.g. locally defined classes).
+    try:
+        return pickle.loads(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return copy.deepcopy(model)
+
+
+def model_to_dict(model: Any, mode: str = "python") -> dict[str, Any]:
+    return dict(_dump_fn(type(model))(model, mode))
 
 
 def build_model(model_cls: type[Any], values: dict[str, Any]) -> Any:
-    if hasattr(model_cls, "model_validate"):
-        return model_cls.model_validate(values)
-    return model_cls(**values)
+    return _validate_fn(model_cls)(values)
 
 
 def deep_copy_model(model: Any) -> Any:
-    if hasattr(model, "model_copy"):
-        return model.model_copy(deep=True)
-    if hasattr(model, "copy"):
-        try:
-            return model.copy(deep=True)
-        except TypeError:
-            return model.copy()
-    return copy.deepcopy(model)
+    return _copy_fn(type(model))(model)
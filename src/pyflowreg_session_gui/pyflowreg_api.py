@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+_DISCOVER_FN: Callable[[Any], Any] | None = None
 
+
+@cache
 def get_session_config_class() -> type[Any]:
     from pyflowreg.session.config import SessionConfig
 
@@ -16,6 +21,11 @@ def load_session_config(path: str | Path) -> Any:
 
 
 def discover_input_files_for_config(config: Any) -> list[Path]:
-    from pyflowreg.session.stage1_compensate import discover_input_files
+    # Only the function reference is cached; discovery itself depends on the filesystem.
+    global _DISCOVER_FN
+    if _DISCOVER_FN is None:
+        from pyflowreg.session.stage1_compensate import discover_input_files
+
+        _DISCOVER_FN = discover_input_files
 
-    return list(discover_input_files(config))
+    return list(_DISCOVER_FN(config))
@@ -60,6 +60,9 @@ class RunLocalTab(QWidget):
         self._runner.run_finished.connect(self._on_run_finished)
         self._runner.run_failed.connect(self._on_run_failed)
 
+    def shutdown(self) -> None:
+        self._runner.shutdown()
+
     def _set_buttons_enabled(self, enabled: bool) -> None:
         self.run_all_button.setEnabled(enabled)
         self.run_stage1_button.setEnabled(enabled)
@@ -1,61 +1,79 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
 from typing import Any
 
 import yaml
 
 from .model_utils import model_to_dict
 
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _BaseDumper
+
 RELATIVE_PATH_FIELDS = {"output_root", "final_results", "center"}
 
 
-def _convert_paths_to_strings(value: Any) -> Any:
-    if isinstance(value, Path):
-        return str(value)
-    if isinstance(value, dict):
-        return {k: _convert_paths_to_strings(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_convert_paths_to_strings(v) for v in value]
-    if isinstance(value, tuple):
-        return [_convert_paths_to_strings(v) for v in value]
-    return value
+class _ConfigDumper(_BaseDumper):
+    """Safe YAML dumper (libyaml-backed when available) that also emits paths as strings."""
 
 
-def _maybe_relative(path_value: Any, root_path: Path | None, prefer_relative: bool) -> Any:
-    if not prefer_relative or root_path is None or not isinstance(path_value, str):
-        return path_value
+_ConfigDumper.add_multi_representer(
+    PurePath, lambda dumper, value: dumper.represent_str(os.fspath(value))
+)
+_ConfigDumper.add_representer(tuple, _BaseDumper.represent_list)
 
-    candidate = Path(path_value)
-    if not candidate.is_absolute() or not root_path.is_absolute():
-        return path_value
 
-    try:
-        return str(candidate.relative_to(root_path))
-    except ValueError:
+def _root_prefix(root_path: Path | None) -> str | None:
+    if root_path is None or not root_path.is_absolute():
+        return None
+    return os.path.normcase(os.path.normpath(root_path)).rstrip(os.sep) + os.sep
+
+
+def _maybe_relative(path_value: Any, root_prefix: str | None) -> Any:
+    # Plain prefix test on normalized strings; normcase keeps the length, so the slice offset
+    # applies to the un-lowered path as well.
+    if not isinstance(path_value, str):
+        if not isinstance(path_value, os.PathLike):
+            return path_value
+        path_value = os.fspath(path_value)
+    if root_prefix is None or not isinstance(path_value, str):
         return path_value
 
+    # The separator appended to the path also matches the root itself, which becomes ".".
+    normalized = os.path.normpath(path_value)
+    if (os.path.normcase(normalized) + os.sep).startswith(root_prefix):
+        return normalized[len(root_prefix) :] or "."
+    return path_value
+
 
 def serialize_config_to_yaml(config: Any, path: str | Path, prefer_relative: bool = True) -> None:
     """Serialize SessionConfig-like model to YAML, preserving relative paths under root when possible."""
 
     output_path = Path(path)
-    data = _convert_paths_to_strings(model_to_dict(config))
+    # Paths and tuples nested anywhere are converted by _ConfigDumper while emitting; only the
+    # shallow top-level path fields are rewritten here. Python mode keeps non-finite floats, which
+    # pydantic's json mode would turn into null.
+    data = model_to_dict(config)
 
     root_path: Path | None = None
     root_raw = data.get("root") if isinstance(data, dict) else None
-    if isinstance(root_raw, str) and root_raw:
+    if isinstance(root_raw, PurePath) or (isinstance(root_raw, str) and root_raw):
         root_path = Path(root_raw)
 
+    root_prefix = _root_prefix(root_path) if prefer_relative else None
+
     if isinstance(data, dict):
         for field_name in RELATIVE_PATH_FIELDS:
             if field_name in data:
-                data[field_name] = _maybe_relative(data[field_name], root_path, prefer_relative)
+                data[field_name] = _maybe_relative(data[field_name], root_prefix)
 
         flow_options = data.get("flow_options")
-        if isinstance(flow_options, str):
-            data["flow_options"] = _maybe_relative(flow_options, root_path, prefer_relative)
+        if isinstance(flow_options, (str, os.PathLike)):
+            data["flow_options"] = _maybe_relative(flow_options, root_prefix)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(data, handle, sort_keys=False)
+        yaml.dump(data, handle, Dumper=_ConfigDumper, sort_keys=False)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import math
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Any
 
 import bootstrap  # noqa: F401
 import yaml
 
+try:
+    import pydantic
+except ImportError:  # pragma: no cover - pydantic ships with pyflowreg
+    pydantic = None
+
 from pyflowreg_session_gui.config_io import load_config_from_file, save_config_to_yaml
 
 
@@ -48,3 +56,61 @@ class ConfigIoRoundtripTests(unittest.TestCase):
             loaded = load_config_from_file(yaml_path, session_config_cls=FakeSessionConfig)
             self.assertEqual(loaded.output_root, "output")
             self.assertEqual(loaded.final_results, "final")
+
+    def test_yaml_writes_root_itself_as_dot(self) -> None:
+        root = Path.cwd() / "tmp_dataset_root"
+        cfg = FakeSessionConfig(
+            root=str(root),
+            output_root=str(root),
+            final_results=str(root) + os.sep,
+            center=str(root) + "_sibling",
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = Path(tmp_dir) / "session_config.yaml"
+            save_config_to_yaml(cfg, yaml_path, prefer_relative=True)
+
+            raw = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+            self.assertEqual(raw["output_root"], ".")
+            self.assertEqual(raw["final_results"], ".")
+            self.assertEqual(raw["center"], str(root) + "_sibling")
+
+    def test_yaml_serializes_path_and_tuple_values(self) -> None:
+        root = Path.cwd() / "tmp_dataset_root"
+        cfg = FakeSessionConfig(
+            root=root,
+            output_root=root / "output",
+            center=Path("/elsewhere/center.npy"),
+            flow_options={"levels": 3, "shape": (4, 5), "weights": root / "w.npy"},
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = Path(tmp_dir) / "session_config.yaml"
+            save_config_to_yaml(cfg, yaml_path, prefer_relative=True)
+
+            raw = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+            self.assertEqual(raw["root"], str(root))
+            self.assertEqual(raw["output_root"], "output")
+            self.assertEqual(raw["center"], str(Path("/elsewhere/center.npy")))
+            self.assertEqual(raw["flow_options"]["shape"], [4, 5])
+            self.assertEqual(raw["flow_options"]["weights"], str(root / "w.npy"))
+
+    @unittest.skipUnless(pydantic is not None, "pydantic is required for this test.")
+    def test_yaml_keeps_non_finite_floats_of_pydantic_models(self) -> None:
+        class PydanticSessionConfig(pydantic.BaseModel):
+            root: Path
+            flow_options: dict[str, Any] = pydantic.Field(default_factory=dict)
+
+        cfg = PydanticSessionConfig(
+            root=Path.cwd(), flow_options={"alpha": math.nan, "eta": math.inf, "shape": (2, 3)}
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = Path(tmp_dir) / "session_config.yaml"
+            save_config_to_yaml(cfg, yaml_path, prefer_relative=True)
+
+            raw = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+            self.assertEqual(raw["root"], str(Path.cwd()))
+            self.assertTrue(math.isnan(raw["flow_options"]["alpha"]))
+            self.assertEqual(raw["flow_options"]["eta"], math.inf)
+            self.assertEqual(raw["flow_options"]["shape"], [2, 3])
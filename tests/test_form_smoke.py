@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import math
 import os
 import unittest
+import warnings
 from pathlib import Path
-from typing import Literal
+from types import SimpleNamespace
+from typing import ClassVar, Literal
 
 import bootstrap  # noqa: F401
 
@@ -70,3 +73,142 @@ class FormSmokeTests(unittest.TestCase):
         self.assertIsInstance(cfg, FakeSessionConfig)
 
         app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_combo_setters_select_matching_option(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        form = SessionConfigForm(FakeSessionConfig)
+
+        form.set_form_data({"mode": "accurate"})
+        self.assertEqual(form.get_form_data()["mode"], "accurate")
+
+        form.set_form_data({"mode": "unknown"})
+        self.assertEqual(form.get_form_data()["mode"], "accurate")
+
+        app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_set_from_config_reads_field_attributes(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        form = SessionConfigForm(FakeSessionConfig)
+
+        config = SimpleNamespace(n_iters=7, mode="accurate", scheduler="dask")
+        form.set_from_config(config)
+
+        values = form.get_form_data()
+        self.assertEqual(values["n_iters"], 7)
+        self.assertEqual(values["mode"], "accurate")
+        self.assertEqual(values["scheduler"], "dask")
+        self.assertEqual(values["alpha"], 1.5)
+
+        app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_dict_editor_matches_stdlib_json(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        form = SessionConfigForm(FakeSessionConfig)
+
+        wide = 123456789012345678901234567890
+        negative = -9999999999999999999
+        form.set_form_data(
+            {
+                "backend_params": {
+                    "nan": math.nan,
+                    "inf": math.inf,
+                    "wide": wide,
+                    "negative": negative,
+                }
+            }
+        )
+        values = form.get_form_data()["backend_params"]
+        self.assertTrue(math.isnan(values["nan"]))
+        self.assertEqual(values["inf"], math.inf)
+        self.assertEqual(values["wide"], wide)
+        self.assertEqual(values["negative"], negative)
+        self.assertIsInstance(values["negative"], int)
+
+        editor = form._bindings["backend_params"].editor
+        editor.setPlainText('{"a": NaN, "b": -Infinity, "c": 1e400}')
+        values = form.get_form_data()["backend_params"]
+        self.assertTrue(math.isnan(values["a"]))
+        self.assertEqual(values["b"], -math.inf)
+        self.assertEqual(values["c"], math.inf)
+
+        editor.setPlainText('{"a": ')
+        with self.assertRaises(ValueError):
+            form.get_form_data()
+
+        app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_rejected_value_raises_when_set(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        form = SessionConfigForm(FakeSessionConfig)
+        form.set_form_data({"n_iters": 9})
+
+        with self.assertRaises(ValueError):
+            form.set_form_data({"n_iters": "many"})
+        with self.assertRaises(OverflowError), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # shiboken warns before raising
+            form.set_form_data({"n_iters": 10**12})
+
+        self.assertEqual(form.get_form_data()["n_iters"], 9)
+        self.assertTrue(form.updatesEnabled())
+        self.assertFalse(form.signalsBlocked())
+
+        app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_dict_values_are_not_shared_between_reads(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        form = SessionConfigForm(FakeSessionConfig)
+        form.set_form_data({"backend_params": {"a": 1, "nested": {"b": [2]}}})
+
+        first = form.get_form_data()["backend_params"]
+        first["a"] = 2
+        first["nested"]["b"].append(3)
+
+        self.assertEqual(form.get_form_data()["backend_params"], {"a": 1, "nested": {"b": [2]}})
+
+        app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_mutable_defaults_are_not_shared_between_forms(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        scheduler_field = FakeField(dict, default=...)
+        scheduler_field.default_factory = lambda: {"n": 1}
+
+        class FactoryConfig:
+            model_fields: ClassVar[dict[str, FakeField]] = {
+                "scheduler": scheduler_field,
+                "flow_backend": FakeField(dict, default={"m": 1}),
+            }
+
+        values = SessionConfigForm(FactoryConfig).get_form_data()
+        values["scheduler"]["n"] = 99
+        values["flow_backend"]["m"] = 99
+
+        fresh = SessionConfigForm(FactoryConfig).get_form_data()
+        self.assertEqual(fresh["scheduler"], {"n": 1})
+        self.assertEqual(fresh["flow_backend"], {"m": 1})
+
+        app.processEvents()
+
+    @unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for GUI smoke test.")
+    def test_set_from_config_does_not_share_mutable_values(self) -> None:
+        app = QApplication.instance() or QApplication([])
+        form = SessionConfigForm(FakeSessionConfig)
+        config = SimpleNamespace(
+            scheduler={"partition": "gpu"},
+            flow_options={"alpha": 2, "backend_params": {"device": "cpu"}},
+        )
+        form.set_from_config(config)
+
+        values = form.get_form_data()
+        values["scheduler"]["partition"] = "cpu"
+        values["flow_options"]["backend_params"]["device"] = "cuda"
+
+        self.assertEqual(config.scheduler, {"partition": "gpu"})
+        self.assertEqual(config.flow_options["backend_params"], {"device": "cpu"})
+
+        app.processEvents()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import textwrap
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import bootstrap  # noqa: F401
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PySide6.QtCore import QEventLoop, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from pyflowreg_session_gui import local_runner
+    from pyflowreg_session_gui.local_runner import LocalRunner
+
+    HAVE_PYSIDE6 = True
+except ImportError:
+    QApplication = None  # type: ignore[assignment]
+    HAVE_PYSIDE6 = False
+
+# Minimal stand-in for the pyflowreg stage modules imported by the worker script. Stage 1
+# behaves according to the "behaviour" key of the session config it is given.
+STUB_MODULES = {
+    "pyflowreg/__init__.py": "",
+    "pyflowreg/session/__init__.py": "",
+    "pyflowreg/session/config.py": """
+        import yaml
+
+
+        class SessionConfig(dict):
+            @classmethod
+            def from_file(cls, path):
+                with open(path, encoding="utf-8") as handle:
+                    return cls(yaml.safe_load(handle))
+    """,
+    "pyflowreg/session/stage1_compensate.py": """
+        import sys
+        import time
+
+
+        def run_stage1(config):
+            behaviour = config["behaviour"]
+            if behaviour == "ok":
+                print("stage1 ok")
+                return
+            if behaviour == "split":
+                # One two-byte UTF-8 character, written in two separately flushed halves.
+                encoded = "caf\u00e9 done\\n".encode("utf-8")
+                sys.stdout.flush()
+                sys.stdout.buffer.write(encoded[:4])
+                sys.stdout.buffer.flush()
+                time.sleep(0.3)
+                sys.stdout.buffer.write(encoded[4:])
+                sys.stdout.buffer.flush()
+                return
+            if behaviour == "sleep":
+                print("stage1 sleeping", flush=True)
+                time.sleep(60)
+                return
+            if behaviour == "partial":
+                print("partial", end="", flush=True)
+            raise RuntimeError("stage1 boom")
+    """,
+    "pyflowreg/session/stage2_between_avgs.py": """
+        def run_stage2(config):
+            return 0, None, None
+    """,
+    "pyflowreg/session/stage3_valid_mask.py": """
+        def run_stage3(config, middle_idx, displacements):
+            pass
+    """,
+}
+
+
+@unittest.skipUnless(HAVE_PYSIDE6, "PySide6 is required for local runner tests.")
+class LocalRunnerWorkerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QApplication.instance() or QApplication([])
+        cls._stub_dir = tempfile.TemporaryDirectory()
+        for relative_path, source in STUB_MODULES.items():
+            module_path = Path(cls._stub_dir.name) / relative_path
+            module_path.parent.mkdir(parents=True, exist_ok=True)
+            module_path.write_text(textwrap.dedent(source), encoding="utf-8")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._stub_dir.cleanup()
+
+    def setUp(self) -> None:
+        python_path = os.pathsep.join(
+            filter(None, [self._stub_dir.name, os.environ.get("PYTHONPATH")])
+        )
+        patches = [
+            mock.patch.dict(os.environ, {"PYTHONPATH": python_path}),
+            # Run the script through -c so the test never writes into the user cache.
+            mock.patch.object(local_runner, "_worker_script_dir", return_value=None),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.runner = LocalRunner()
+        self.addCleanup(self.runner.shutdown)
+        self.events: list[tuple[str, object]] = []
+        self.runner.log_emitted.connect(lambda text: self.events.append(("log", text)))
+        self.runner.run_failed.connect(lambda message: self.events.append(("failed", message)))
+        self.runner.run_finished.connect(lambda code: self.events.append(("finished", code)))
+
+    def _run(self, behaviour: str) -> None:
+        loop = QEventLoop()
+        self.runner.run_finished.connect(loop.quit)
+        QTimer.singleShot(30000, loop.quit)
+        self.runner.start(SimpleNamespace(behaviour=behaviour), "stage1")
+        loop.exec()
+        self.runner.run_finished.disconnect(loop.quit)
+        self.assertFalse(self.runner.is_running())
+
+    def _log_text(self) -> str:
+        return "\n".join(str(value) for kind, value in self.events if kind == "log")
+
+    def test_successful_run_reports_exit_code_zero(self) -> None:
+        self._run("ok")
+
+        self.assertEqual(self.events[-1], ("finished", 0))
+        self.assertNotIn("failed", [kind for kind, _ in self.events])
+        self.assertIn("stage1 ok", self._log_text())
+
+    def test_exception_is_logged_before_failure(self) -> None:
+        self._run("raise")
+
+        kinds = [kind for kind, _ in self.events]
+        self.assertEqual(kinds[-2:], ["failed", "finished"])
+        self.assertEqual(self.events[-1], ("finished", 1))
+        self.assertIn("RuntimeError: stage1 boom", self._log_text())
+
+    def test_partial_line_before_sentinel_completes_run(self) -> None:
+        self._run("partial")
+
+        self.assertEqual(self.events[-1], ("finished", 1))
+        self.assertIn("partial", self._log_text())
+        self.assertNotIn("__DONE__", self._log_text())
+
+        # The same worker accepts the next run.
+        self.events.clear()
+        self._run("ok")
+        self.assertEqual(self.events[-1], ("finished", 0))
+
+    def test_multibyte_character_split_across_reads_is_decoded(self) -> None:
+        self._run("split")
+
+        self.assertEqual(self.events[-1], ("finished", 0))
+        # "caf" is shown as soon as it arrives; the split character must still decode intact.
+        self.assertIn("caf", self._log_text())
+        self.assertIn("\u00e9 done", self._log_text())
+        self.assertNotIn("\ufffd", self._log_text())
+
+    def test_shutdown_during_run_kills_worker_without_signals(self) -> None:
+        self.runner.start(SimpleNamespace(behaviour="sleep"), "stage1")
+        deadline = time.monotonic() + 30
+        while "stage1 sleeping" not in self._log_text() and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        self.assertIn("stage1 sleeping", self._log_text())
+
+        started = time.monotonic()
+        self.runner.shutdown()
+
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertFalse(self.runner.is_running())
+        self.assertEqual([kind for kind, _ in self.events], ["log"] * len(self.events))
+
+
+if __name__ == "__main__":
+    unittest.main()